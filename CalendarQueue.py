@@ -0,0 +1,95 @@
+import bisect
+
+class CalendarQueue:
+    # Cola de prioridad tipo calendario (Brown, 1988): las claves se reparten en
+    # cubetas de ancho fijo como los dias de un anio. Con un ancho adecuado a la
+    # distribucion de claves, insertar y extraer el minimo cuesta O(1) en promedio.
+    def __init__(self, key, bucket_count=2, bucket_width=1):
+        self.key = key
+        self.size = 0
+        self._counter = 0  # Desempate FIFO entre claves iguales
+        self._build(bucket_count, bucket_width, 0)
+
+    def _build(self, bucket_count, bucket_width, start_key):
+        self.bucket_count = bucket_count
+        self.bucket_width = bucket_width
+        self.buckets = [[] for _ in range(bucket_count)]
+        self._set_position(start_key)
+
+    def _set_position(self, key):
+        day = int(key // self.bucket_width)
+        self.last_key = key
+        self.current_bucket = day % self.bucket_count
+        self.bucket_top = (day + 1) * self.bucket_width
+
+    def _bucket_index(self, key):
+        return int(key // self.bucket_width) % self.bucket_count
+
+    def __len__(self):
+        return self.size
+
+    def __bool__(self):
+        return self.size > 0
+
+    def __iter__(self):
+        entries = sorted(entry for bucket in self.buckets for entry in bucket)
+        return iter(item for _, _, item in entries)
+
+    def push(self, item):
+        key = self.key(item)
+        bisect.insort(self.buckets[self._bucket_index(key)], (key, self._counter, item))
+        self._counter += 1
+        self.size += 1
+        if key < self.last_key:
+            self._set_position(key)
+        if self.size > 2 * self.bucket_count:
+            self._resize(2 * self.bucket_count)
+
+    def _locate(self):
+        # Recorre el "anio" actual desde la cubeta en curso buscando el minimo
+        index, top = self.current_bucket, self.bucket_top
+        for _ in range(self.bucket_count):
+            bucket = self.buckets[index]
+            if bucket and bucket[0][0] < top:
+                self.current_bucket, self.bucket_top = index, top
+                self.last_key = bucket[0][0]
+                return index
+            index = (index + 1) % self.bucket_count
+            top += self.bucket_width
+        # Hueco de mas de un anio: busqueda directa entre las cabezas de cubeta
+        index = min((i for i, bucket in enumerate(self.buckets) if bucket), key=lambda i: self.buckets[i][0])
+        self._set_position(self.buckets[index][0][0])
+        return index
+
+    def peek_key(self):
+        if not self.size:
+            raise IndexError("peek from an empty CalendarQueue")
+        return self.buckets[self._locate()][0][0]
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty CalendarQueue")
+        _, _, item = self.buckets[self._locate()].pop(0)
+        self.size -= 1
+        if self.bucket_count > 2 and self.size < self.bucket_count // 2:
+            self._resize(self.bucket_count // 2)
+        return item
+
+    def remove(self, item):
+        bucket = self.buckets[self._bucket_index(self.key(item))]
+        for i, entry in enumerate(bucket):
+            if entry[2] is item:
+                del bucket[i]
+                self.size -= 1
+                return
+        raise ValueError("item not in CalendarQueue")
+
+    def _resize(self, bucket_count):
+        entries = sorted(entry for bucket in self.buckets for entry in bucket)
+        # Ancho de cubeta: tres veces la separacion media entre las claves mas bajas
+        sample = [key for key, _, _ in entries[:25]]
+        gaps = [b - a for a, b in zip(sample, sample[1:])]
+        width = 3 * sum(gaps) / len(gaps) if gaps and sum(gaps) else self.bucket_width
+        self._build(bucket_count, width, entries[0][0] if entries else self.last_key)
+        for entry in entries:
+            self.buckets[self._bucket_index(entry[0])].append(entry)
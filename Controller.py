@@ -1,14 +1,69 @@
+import math
 import random
 from FiFo import FIFO, Process as FIFOProcess
-from SJF import SJF, Process as SJFProcess
-from Prioridad import Prioridad, Process as PrioridadProcess
+from SJF import SJF, SRTF, Process as SJFProcess
+from Prioridad import Prioridad, PrioridadApropiativa, Process as PrioridadProcess
+from RoundRobin import RoundRobin
+from EDF import EDF, Process as EDFProcess
+from IOProcess import IOProcess
+from TimerWheel import TimerWheel
+
+class AdmissionControl:
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    DROP_LOWEST_PRIORITY = "drop_lowest_priority"
+    REJECT_RETRY = "reject_retry"
+    POLICIES = (DROP_NEWEST, DROP_OLDEST, DROP_LOWEST_PRIORITY, REJECT_RETRY)
+
+    def __init__(self, capacity=None, policy=DROP_NEWEST, retry_after=3):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown admission policy: {policy}")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1 or None")
+        if retry_after < 0:
+            raise ValueError("retry_after must not be negative")
+        self.capacity = capacity  # None = cola sin limite
+        self.policy = policy
+        self.retry_after = retry_after
+
+    def admit(self, process, queue, ready_count):
+        # Devuelve (admitido, descartado); descartado puede ser el propio proceso.
+        # La capacidad cuenta solo procesos en espera, igual en todos los algoritmos
+        if self.capacity is None or ready_count < self.capacity:
+            return True, None
+        if self.policy == self.REJECT_RETRY:
+            return False, None
+        if self.policy == self.DROP_NEWEST:
+            return False, process
+        # Solo se expulsan procesos que aun no han empezado a ejecutarse
+        waiting = [p for p in queue if p._first_time]
+        if not waiting:
+            return False, process
+        if self.policy == self.DROP_OLDEST:
+            return True, min(waiting, key=lambda p: p.getArrivalTime())
+        if not hasattr(process, "priority"):
+            # Sin prioridades (FIFO, SJF, EDF...) DROP_LOWEST_PRIORITY equivale a DROP_NEWEST
+            return False, process
+        # Un numero mayor es menor prioridad; en empate se descarta el mas nuevo
+        victim = max(waiting, key=lambda p: (p.priority, p.getArrivalTime()))
+        if victim.priority <= process.priority:
+            return False, process
+        return True, victim
 
 class Time:
-    def __init__(self, algorithm, generator, debug=False):
+    def __init__(self, algorithm, generator, debug=False, admission=None):
         self.current_time = 0
         self.algorithm = algorithm
         self.generator = generator
         self.completed_processes = []
+        self.dropped_processes = []
+        self.pending_retries = []  # (tiempo de reintento, proceso)
+        self.retry_count = 0
+        self.blocked = TimerWheel()  # Procesos esperando E/S
+        self.cpu_busy_time = 0
+        self.io_busy_time = 0
+        self.overlap_time = 0
+        self.admission = admission if admission is not None else AdmissionControl()
         self.debug = debug
         self.output_callback = print  # Default to console print
 
@@ -24,8 +79,54 @@ class Time:
     def get_generator(self):
         return self.generator
 
+    def set_admission(self, admission):
+        self.admission = admission
+
+    def get_context_switches(self):
+        # Cada vez que la CPU pasa a un proceso distinto, por fin, E/S o apropiacion
+        return self.algorithm.context_switches
+
+    def reset(self):
+        self.current_time = 0
+        self.completed_processes = []
+        self.dropped_processes = []
+        self.pending_retries = []
+        self.retry_count = 0
+        self.blocked = TimerWheel()
+        self.cpu_busy_time = 0
+        self.io_busy_time = 0
+        self.overlap_time = 0
+
     def add_process(self, process):
-        self.algorithm.add_process(process, self.current_time)
+        # La llegada se fija en el primer intento para que los reintentos cuenten en Te/Ts
+        if process.getArrivalTime() is None:
+            process.setArrivalTime(self.current_time)
+        admitted, dropped = self.admission.admit(process, self.algorithm.queue, self.algorithm.ready_count())
+        if dropped is not None:
+            if dropped is not process:
+                self.algorithm.queue.remove(dropped)
+            self.dropped_processes.append(dropped)
+        if admitted:
+            self.algorithm.add_process(process, self.current_time)
+        elif dropped is None:
+            self.retry_count += 1
+            self.pending_retries.append((self.current_time + self.admission.retry_after, process))
+
+    def _resubmit_retries(self):
+        due = [process for retry_time, process in self.pending_retries if retry_time <= self.current_time]
+        self.pending_retries = [entry for entry in self.pending_retries if entry[0] > self.current_time]
+        for process in due:
+            self.add_process(process)
+
+    def _wake_blocked(self):
+        # Los procesos que terminan su E/S vuelven a la cola de listos pasando
+        # por el control de admision, asi que pueden descartarse o reintentarse
+        for process in self.blocked.advance(self.current_time):
+            process.start_next_burst()
+            self.add_process(process)
+
+    def _cpu_busy(self):
+        return bool(self.algorithm.queue) or getattr(self.algorithm, "current_process", None) is not None
 
     def set_output_callback(self, callback):
         self.output_callback = callback
@@ -33,41 +134,113 @@ class Time:
     def run(self):
         max_cycles = 30
         process_generator = self.generator.generate_processes()
-        while self.current_time < max_cycles or self.algorithm.queue:
+        while self.current_time < max_cycles or self._cpu_busy() or self.pending_retries or len(self.blocked):
+            self._resubmit_retries()
+            self._wake_blocked()
             if random.random() < 0.3 and self.current_time < max_cycles:
                 new_process = next(process_generator)
                 self.add_process(new_process)
+            cpu_busy = self._cpu_busy()
+            io_busy = len(self.blocked) > 0
+            self.cpu_busy_time += cpu_busy
+            self.io_busy_time += io_busy
+            self.overlap_time += cpu_busy and io_busy
             completed_process = self.algorithm.execute(self.current_time, self.debug, self.output_callback)
             if completed_process:
-                self.completed_processes.append(completed_process)
+                if isinstance(completed_process, IOProcess) and completed_process.has_pending_io():
+                    # Se bloquea desde el final de la rafaga de CPU
+                    self.blocked.schedule(self.current_time + 1 + completed_process.getIOTime(), completed_process)
+                else:
+                    self.completed_processes.append(completed_process)
             self.current_time += 1
 
 class ProcessGenerator:
-    def __init__(self, min_burst_time, max_burst_time, process_class, min_priority=None, max_priority=None):
+    def __init__(self, min_burst_time, max_burst_time, process_class, min_priority=None, max_priority=None,
+                 max_cpu_bursts=1, min_io_time=1, max_io_time=5, min_slack=None, max_slack=None):
         self.min_burst_time = min_burst_time
         self.max_burst_time = max_burst_time
         self.process_class = process_class
         self.min_priority = min_priority
         self.max_priority = max_priority
+        self.min_slack = min_slack
+        self.max_slack = max_slack
+        self.max_cpu_bursts = max_cpu_bursts
+        self.min_io_time = min_io_time
+        self.max_io_time = max_io_time
         self.process_number = 1
 
+    def _generate_bursts(self):
+        bursts = [random.randint(self.min_burst_time, self.max_burst_time)]
+        for _ in range(random.randint(1, self.max_cpu_bursts) - 1):
+            bursts.append(random.randint(self.min_io_time, self.max_io_time))
+            bursts.append(random.randint(self.min_burst_time, self.max_burst_time))
+        return bursts
+
+    def _relative_deadline(self, total_work):
+        # El deadline escala con el trabajo total (CPU + E/S) por un factor de holgura
+        return math.ceil(total_work * random.uniform(self.min_slack, self.max_slack))
+
     def generate_processes(self):
         while True:
-            execution_time = random.randint(self.min_burst_time, self.max_burst_time)
+            priority = None
+            with_deadline = self.min_slack is not None and self.max_slack is not None
             if self.min_priority is not None and self.max_priority is not None:
                 priority = random.randint(self.min_priority, self.max_priority)
-                yield self.process_class(f"Process {self.process_number}", execution_time, priority)
+            name = f"Process {self.process_number}"
+            if self.max_cpu_bursts > 1:
+                bursts = self._generate_bursts()
+                relative_deadline = self._relative_deadline(sum(bursts)) if with_deadline else None
+                yield IOProcess(name, bursts, priority, relative_deadline)
             else:
-                yield self.process_class(f"Process {self.process_number}", execution_time)
+                execution_time = random.randint(self.min_burst_time, self.max_burst_time)
+                if priority is not None:
+                    yield self.process_class(name, execution_time, priority)
+                elif with_deadline:
+                    yield self.process_class(name, execution_time, self._relative_deadline(execution_time))
+                else:
+                    yield self.process_class(name, execution_time)
             self.process_number += 1
 
 class Metrics:
     def __init__(self):
         self.processes = []
+        self.dropped_processes = []
+        self.retries = 0
+        self.total_time = 0
+        self.cpu_busy_time = 0
+        self.io_busy_time = 0
+        self.overlap_time = 0
+        self.context_switches = 0
 
     def add_process(self, process):
         self.processes.append(process)
 
+    def add_dropped_process(self, process):
+        self.dropped_processes.append(process)
+
+    def add_retries(self, count):
+        self.retries += count
+
+    def add_context_switches(self, count):
+        self.context_switches += count
+
+    def add_time_counters(self, total_time, cpu_busy_time, io_busy_time, overlap_time):
+        self.total_time = total_time
+        self.cpu_busy_time = cpu_busy_time
+        self.io_busy_time = io_busy_time
+        self.overlap_time = overlap_time
+
+    def calculate_cpu_utilization(self):
+        return self.cpu_busy_time / self.total_time if self.total_time else 0
+
+    def calculate_io_overlap(self):
+        # Fraccion del tiempo con E/S en curso en la que la CPU tambien estaba ocupada
+        return self.overlap_time / self.io_busy_time if self.io_busy_time else 0
+
+    def calculate_drop_rate(self):
+        total = len(self.processes) + len(self.dropped_processes)
+        return len(self.dropped_processes) / total if total else 0
+
     def calculate_average_te(self):
         total_te = sum(process.calculateTe() for process in self.processes)
         return total_te / len(self.processes)
@@ -76,17 +249,47 @@ class Metrics:
         total_ts = sum(process.calculateTs() for process in self.processes)
         return total_ts / len(self.processes)
 
+    @staticmethod
+    def _percentile(values, percentile):
+        # Percentil por rango mas cercano, para ver la cola de latencia bajo sobrecarga
+        values = sorted(values)
+        rank = max(1, math.ceil(percentile / 100 * len(values)))
+        return values[rank - 1]
+
+    def calculate_percentile_ts(self, percentile):
+        return self._percentile((process.calculateTs() for process in self.processes), percentile)
+
+    def _deadline_processes(self):
+        return [process for process in self.processes if getattr(process, "deadline", None) is not None]
+
+    def calculate_deadline_miss_rate(self):
+        # Un proceso descartado por el control de admision tambien pierde su deadline
+        processes = self._deadline_processes()
+        dropped = [process for process in self.dropped_processes if hasattr(process, "relative_deadline")]
+        missed = sum(1 for process in processes if process.getEndTime() > process.deadline) + len(dropped)
+        total = len(processes) + len(dropped)
+        return missed / total if total else 0
+
+    def calculate_percentile_lateness(self, percentile):
+        # Lateness = fin - deadline; negativo si termina antes de su deadline
+        processes = self._deadline_processes()
+        if not processes:
+            return None
+        return self._percentile((process.getEndTime() - process.deadline for process in processes), percentile)
+
 class Gestor:
-    def __init__(self, algorithm, debug=False):
+    def __init__(self, algorithm, debug=False, admission=None):
         self.time = None
         self.algorithm = None
         self.generator = None
         self.fifo_generator = None
         self.sjf_generator = None
         self.prioridad_generator = None
+        self.edf_generator = None
         self.current_algorithm = None
         self.debug = debug
         self.output_callback = print
+        self.admission = admission if admission is not None else AdmissionControl()
         self.initialize_generators(min_burst_time=1, max_burst_time=8)
         self._initialize_time(algorithm, type(algorithm).__name__)
 
@@ -98,7 +301,7 @@ class Gestor:
     def _initialize_time(self, algorithm, generatorName):
         self.algorithm = algorithm
         self.generator = generatorName
-        self.time = Time(algorithm, self.get_generator(), self.debug)
+        self.time = Time(algorithm, self.get_generator(), self.debug, self.admission)
         self.time.set_output_callback(self.output_callback)
         self.current_algorithm = type(algorithm).__name__
 
@@ -106,41 +309,57 @@ class Gestor:
         self.algorithm = algorithm
         self.current_algorithm = type(algorithm).__name__
         if self.time:
-            self.time.current_time = 0  # Reiniciar el tiempo
+            self.time.reset()  # Reiniciar el tiempo y los procesos completados/descartados
             self.time.set_algorithm(algorithm)
-            self.time.completed_processes = []  # Limpiar lista de procesos completados
             self.generator = self.current_algorithm
             self.update_generator()
 
     def get_algorithm(self):
         return self.algorithm
 
+    def set_admission(self, admission):
+        self.admission = admission
+        if self.time:
+            self.time.set_admission(admission)
+
     def set_generator(self, generator_name):
         self.generator = generator_name
         self.update_generator()
 
+    def set_io_bursts(self, max_cpu_bursts, min_io_time=1, max_io_time=5, min_burst_time=1, max_burst_time=8):
+        # Con max_cpu_bursts > 1 los procesos alternan rafagas de CPU y E/S
+        self.initialize_generators(min_burst_time, max_burst_time, max_cpu_bursts, min_io_time, max_io_time)
+        if self.time:
+            self.update_generator()
+
     def get_generator(self):
-        if self.generator == "FIFO":
+        if self.generator in ("FIFO", "RoundRobin"):
             return self.fifo_generator 
-        elif self.generator == "SJF":
+        elif self.generator in ("SJF", "SRTF"):
             return self.sjf_generator
-        elif self.generator == "Prioridad":
+        elif self.generator in ("Prioridad", "PrioridadApropiativa"):
             return self.prioridad_generator
+        elif self.generator == "EDF":
+            return self.edf_generator
 
-        return [self.generator, self.fifo_generator, self.sjf_generator, self.prioridad_generator]
+        return [self.generator, self.fifo_generator, self.sjf_generator, self.prioridad_generator, self.edf_generator]
 
-    def initialize_generators(self, min_burst_time, max_burst_time):
-        self.fifo_generator = ProcessGenerator(min_burst_time, max_burst_time, FIFOProcess)
-        self.sjf_generator = ProcessGenerator(min_burst_time, max_burst_time, SJFProcess)
-        self.prioridad_generator = ProcessGenerator(min_burst_time, max_burst_time, PrioridadProcess, min_priority=1, max_priority=5)
+    def initialize_generators(self, min_burst_time, max_burst_time, max_cpu_bursts=1, min_io_time=1, max_io_time=5):
+        io_options = dict(max_cpu_bursts=max_cpu_bursts, min_io_time=min_io_time, max_io_time=max_io_time)
+        self.fifo_generator = ProcessGenerator(min_burst_time, max_burst_time, FIFOProcess, **io_options)
+        self.sjf_generator = ProcessGenerator(min_burst_time, max_burst_time, SJFProcess, **io_options)
+        self.prioridad_generator = ProcessGenerator(min_burst_time, max_burst_time, PrioridadProcess, min_priority=1, max_priority=5, **io_options)
+        self.edf_generator = ProcessGenerator(min_burst_time, max_burst_time, EDFProcess, min_slack=1.5, max_slack=4, **io_options)
 
     def update_generator(self):
-        if self.generator == "FIFO":
+        if self.generator in ("FIFO", "RoundRobin"):
             self.time.set_generator(self.fifo_generator)
-        elif self.generator == "SJF":
+        elif self.generator in ("SJF", "SRTF"):
             self.time.set_generator(self.sjf_generator)
-        elif self.generator == "Prioridad":
+        elif self.generator in ("Prioridad", "PrioridadApropiativa"):
             self.time.set_generator(self.prioridad_generator)
+        elif self.generator == "EDF":
+            self.time.set_generator(self.edf_generator)
 
     def run(self):
         if self.time:
@@ -148,7 +367,9 @@ class Gestor:
 
 # Example usage
 if __name__ == "__main__":
-    gestor = Gestor(FIFO())
+    # Cola de listos acotada para ver descartes y reintentos bajo sobrecarga
+    gestor = Gestor(FIFO(), admission=AdmissionControl(capacity=4, policy=AdmissionControl.DROP_OLDEST))
+    gestor.set_io_bursts(max_cpu_bursts=3)
     
     # FIFO Example
     print("\nRunning FIFO Algorithm")
@@ -158,9 +379,19 @@ if __name__ == "__main__":
     print(f"Completed processes in FIFO: {len(gestor.time.completed_processes)}")
     for process in gestor.time.completed_processes:
         fifo_metrics.add_process(process)
+    for process in gestor.time.dropped_processes:
+        fifo_metrics.add_dropped_process(process)
+    fifo_metrics.add_retries(gestor.time.retry_count)
+    fifo_metrics.add_time_counters(gestor.time.current_time, gestor.time.cpu_busy_time,
+                                  gestor.time.io_busy_time, gestor.time.overlap_time)
+    fifo_metrics.add_context_switches(gestor.time.get_context_switches())
     if fifo_metrics.processes:
         print(f"FIFO - Average Te: {fifo_metrics.calculate_average_te()}")
         print(f"FIFO - Average Ts: {fifo_metrics.calculate_average_ts()}")
+        print(f"FIFO - p95 Ts: {fifo_metrics.calculate_percentile_ts(95)}")
+        print(f"FIFO - Dropped: {len(fifo_metrics.dropped_processes)} ({fifo_metrics.calculate_drop_rate():.0%}), Retries: {fifo_metrics.retries}")
+        print(f"FIFO - CPU utilization: {fifo_metrics.calculate_cpu_utilization():.0%}, I/O overlap: {fifo_metrics.calculate_io_overlap():.0%}")
+        print(f"FIFO - Context switches: {fifo_metrics.context_switches}")
     else:
         print("FIFO - No processes were completed.")
     print("\n")
@@ -174,9 +405,19 @@ if __name__ == "__main__":
     print(f"Completed processes in SJF: {len(gestor.time.completed_processes)}")
     for process in gestor.time.completed_processes:
         sjf_metrics.add_process(process)
+    for process in gestor.time.dropped_processes:
+        sjf_metrics.add_dropped_process(process)
+    sjf_metrics.add_retries(gestor.time.retry_count)
+    sjf_metrics.add_time_counters(gestor.time.current_time, gestor.time.cpu_busy_time,
+                                  gestor.time.io_busy_time, gestor.time.overlap_time)
+    sjf_metrics.add_context_switches(gestor.time.get_context_switches())
     if sjf_metrics.processes:
         print(f"SJF - Average Te: {sjf_metrics.calculate_average_te()}")
         print(f"SJF - Average Ts: {sjf_metrics.calculate_average_ts()}")
+        print(f"SJF - p95 Ts: {sjf_metrics.calculate_percentile_ts(95)}")
+        print(f"SJF - Dropped: {len(sjf_metrics.dropped_processes)} ({sjf_metrics.calculate_drop_rate():.0%}), Retries: {sjf_metrics.retries}")
+        print(f"SJF - CPU utilization: {sjf_metrics.calculate_cpu_utilization():.0%}, I/O overlap: {sjf_metrics.calculate_io_overlap():.0%}")
+        print(f"SJF - Context switches: {sjf_metrics.context_switches}")
     else:
         print("SJF - No processes were completed.")
     print("\n")
@@ -190,9 +431,77 @@ if __name__ == "__main__":
     print(f"Completed processes in Prioridad: {len(gestor.time.completed_processes)}")
     for process in gestor.time.completed_processes:
         prioridad_metrics.add_process(process)
+    for process in gestor.time.dropped_processes:
+        prioridad_metrics.add_dropped_process(process)
+    prioridad_metrics.add_retries(gestor.time.retry_count)
+    prioridad_metrics.add_time_counters(gestor.time.current_time, gestor.time.cpu_busy_time,
+                                  gestor.time.io_busy_time, gestor.time.overlap_time)
+    prioridad_metrics.add_context_switches(gestor.time.get_context_switches())
     if prioridad_metrics.processes:
         print(f"Prioridad - Average Te: {prioridad_metrics.calculate_average_te()}")
         print(f"Prioridad - Average Ts: {prioridad_metrics.calculate_average_ts()}")
+        print(f"Prioridad - p95 Ts: {prioridad_metrics.calculate_percentile_ts(95)}")
+        print(f"Prioridad - Dropped: {len(prioridad_metrics.dropped_processes)} ({prioridad_metrics.calculate_drop_rate():.0%}), Retries: {prioridad_metrics.retries}")
+        print(f"Prioridad - CPU utilization: {prioridad_metrics.calculate_cpu_utilization():.0%}, I/O overlap: {prioridad_metrics.calculate_io_overlap():.0%}")
+        print(f"Prioridad - Context switches: {prioridad_metrics.context_switches}")
     else:
         print("Prioridad - No processes were completed.")
     print("\n")
+
+    # EDF Example
+    for edf_name, preemptive in (("EDF", False), ("EDF apropiativo", True)):
+        print(f"Running {edf_name} Algorithm")
+        print("-" * 50)
+        gestor.set_algorithm(EDF(preemptive=preemptive))
+        edf_metrics = Metrics()
+        gestor.run()
+        print(f"Completed processes in {edf_name}: {len(gestor.time.completed_processes)}")
+        for process in gestor.time.completed_processes:
+            edf_metrics.add_process(process)
+        for process in gestor.time.dropped_processes:
+            edf_metrics.add_dropped_process(process)
+        edf_metrics.add_retries(gestor.time.retry_count)
+        edf_metrics.add_time_counters(gestor.time.current_time, gestor.time.cpu_busy_time,
+                                      gestor.time.io_busy_time, gestor.time.overlap_time)
+        edf_metrics.add_context_switches(gestor.time.get_context_switches())
+        if edf_metrics.processes:
+            print(f"{edf_name} - Average Te: {edf_metrics.calculate_average_te()}")
+            print(f"{edf_name} - Average Ts: {edf_metrics.calculate_average_ts()}")
+            print(f"{edf_name} - p95 Ts: {edf_metrics.calculate_percentile_ts(95)}")
+            print(f"{edf_name} - Dropped: {len(edf_metrics.dropped_processes)} ({edf_metrics.calculate_drop_rate():.0%}), Retries: {edf_metrics.retries}")
+            print(f"{edf_name} - CPU utilization: {edf_metrics.calculate_cpu_utilization():.0%}, I/O overlap: {edf_metrics.calculate_io_overlap():.0%}")
+            print(f"{edf_name} - Context switches: {edf_metrics.context_switches}")
+            print(f"{edf_name} - Deadline miss rate: {edf_metrics.calculate_deadline_miss_rate():.0%}")
+            print(f"{edf_name} - Lateness p50/p95/p99: {edf_metrics.calculate_percentile_lateness(50)}/"
+                  f"{edf_metrics.calculate_percentile_lateness(95)}/{edf_metrics.calculate_percentile_lateness(99)}")
+        else:
+            print(f"{edf_name} - No processes were completed.")
+        print("\n")
+
+    # Preemptive Examples
+    for preemptive_name, algorithm in (("SRTF", SRTF()), ("Prioridad apropiativa", PrioridadApropiativa()),
+                                       ("Round Robin", RoundRobin(quantum=2))):
+        print(f"Running {preemptive_name} Algorithm")
+        print("-" * 50)
+        gestor.set_algorithm(algorithm)
+        preemptive_metrics = Metrics()
+        gestor.run()
+        print(f"Completed processes in {preemptive_name}: {len(gestor.time.completed_processes)}")
+        for process in gestor.time.completed_processes:
+            preemptive_metrics.add_process(process)
+        for process in gestor.time.dropped_processes:
+            preemptive_metrics.add_dropped_process(process)
+        preemptive_metrics.add_retries(gestor.time.retry_count)
+        preemptive_metrics.add_time_counters(gestor.time.current_time, gestor.time.cpu_busy_time,
+                                             gestor.time.io_busy_time, gestor.time.overlap_time)
+        preemptive_metrics.add_context_switches(gestor.time.get_context_switches())
+        if preemptive_metrics.processes:
+            print(f"{preemptive_name} - Average Te: {preemptive_metrics.calculate_average_te()}")
+            print(f"{preemptive_name} - Average Ts: {preemptive_metrics.calculate_average_ts()}")
+            print(f"{preemptive_name} - p95 Ts: {preemptive_metrics.calculate_percentile_ts(95)}")
+            print(f"{preemptive_name} - Dropped: {len(preemptive_metrics.dropped_processes)} ({preemptive_metrics.calculate_drop_rate():.0%}), Retries: {preemptive_metrics.retries}")
+            print(f"{preemptive_name} - CPU utilization: {preemptive_metrics.calculate_cpu_utilization():.0%}, I/O overlap: {preemptive_metrics.calculate_io_overlap():.0%}")
+            print(f"{preemptive_name} - Context switches: {preemptive_metrics.context_switches}")
+        else:
+            print(f"{preemptive_name} - No processes were completed.")
+        print("\n")
@@ -0,0 +1,99 @@
+from CalendarQueue import CalendarQueue
+
+class Process:
+    _first_time = True
+    def __init__(self, name, execution_time, relative_deadline):
+        self.name = name
+        self.execution_time = execution_time
+        self.relative_deadline = relative_deadline
+        self.deadline = None  # Absoluto, se fija al llegar
+        self._arrival_time = None
+        self._start_time = None
+        self._end_time = None
+
+    def getArrivalTime(self):
+        return self._arrival_time
+    
+    def setArrivalTime(self, arrival_time):
+        self._arrival_time = arrival_time
+
+    def getStartTime(self):
+        return self._start_time
+    
+    def setStartTime(self, start_time):
+        self._start_time = start_time
+
+    def getEndTime(self):
+        return self._end_time
+    
+    def setEndTime(self, end_time):
+        self._end_time = end_time
+
+    def calculateTe(self):
+        return self._start_time - self._arrival_time
+
+    def calculateTs(self):
+        return self._end_time - self._arrival_time
+
+class EDF:
+    def __init__(self, preemptive=False):
+        self.queue = CalendarQueue(key=lambda p: p.deadline)
+        self.last_process = None  # Ultimo proceso que uso la CPU
+        self.last_time = None
+        self.current_process = None
+        self.preemptive = preemptive
+        self.context_switches = 0  # Cambios de la CPU a un proceso distinto
+
+    def add_process(self, process, current_time):
+        if process.getArrivalTime() is None:
+            process.setArrivalTime(current_time)
+        if getattr(process, "deadline", None) is None:
+            process.deadline = process.getArrivalTime() + process.relative_deadline
+        self.queue.push(process)
+
+    def ready_count(self):
+        # Procesos en espera; current_process (o la cabeza, si no hay) ocupa la CPU
+        return len(self.queue) - (0 if self.current_process is not None or not self.queue else 1)
+
+    def execute(self, current_time, debug=False, output_callback=print):
+        msg = f"Current Time: {current_time:<3}"
+        if debug:
+            print(msg, end="\t" if self.queue or self.current_process else "\n")
+        output_callback(msg, end="\t" if self.queue or self.current_process else "\n")
+
+        # En modo apropiativo, un proceso con deadline anterior desplaza al actual
+        if self.preemptive and self.current_process and self.queue and self.queue.peek_key() < self.current_process.deadline:
+            self.queue.push(self.current_process)
+            self.current_process = None
+        if self.current_process is None and self.queue:
+            self.current_process = self.queue.pop()
+        if self.current_process:
+            process = self.current_process
+            if process._first_time:
+                process.setStartTime(current_time)
+                msg = f"{process.name:<10} Arrival Time: {process.getArrivalTime():<5} Execution Time: {process.execution_time:<5} D:{process.deadline:<3}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+                process._first_time = False
+            elif process is not self.last_process or current_time != self.last_time + 1:
+                # Reanudado tras otro proceso o tras E/S: se muestra su nombre
+                msg = f"{process.name:<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+            else:
+                msg = f"{'':<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+            process.execution_time -= 1
+            if self.last_process is not None and process is not self.last_process:
+                self.context_switches += 1
+            self.last_process = process
+            self.last_time = current_time
+            if process.execution_time == 0:
+                process.setEndTime(current_time + 1)
+                self.current_process = None
+                return process
+        return None
@@ -36,12 +36,19 @@ class Process:
 class FIFO:
     def __init__(self):
         self.queue = []
+        self.last_process = None  # Ultimo proceso que uso la CPU
+        self.last_time = None
+        self.context_switches = 0  # Cambios de la CPU a un proceso distinto
 
     def add_process(self, process, current_time):
         if process.getArrivalTime() is None:
             process.setArrivalTime(current_time)
         self.queue.append(process)
 
+    def ready_count(self):
+        # Procesos en espera; queue[0] es el que ocupa la CPU
+        return max(len(self.queue) - 1, 0)
+
     def execute(self, current_time, debug=False, output_callback=print):
         msg = f"Current Time: {current_time:<3}"
         if debug:
@@ -51,17 +58,28 @@ class FIFO:
         if self.queue:
             process = self.queue[0]
             if process._first_time:
+                process.setStartTime(current_time)
                 msg = f"{process.name:<10} Arrival Time: {process.getArrivalTime():<5} Execution Time: {process.execution_time:<5}"
                 if debug:
                     print(msg)
                 output_callback(msg)
                 process._first_time = False
+            elif process is not self.last_process or current_time != self.last_time + 1:
+                # Reanudado tras otro proceso o tras E/S: se muestra su nombre
+                msg = f"{process.name:<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
             else:
                 msg = f"{'':<29} Execution Time: {process.execution_time:<5}"
                 if debug:
                     print(msg)
                 output_callback(msg)
             process.execution_time -= 1
+            if self.last_process is not None and process is not self.last_process:
+                self.context_switches += 1
+            self.last_process = process
+            self.last_time = current_time
             if process.execution_time == 0:
                 process.setEndTime(current_time + 1)
                 self.queue.pop(0)
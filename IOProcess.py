@@ -0,0 +1,26 @@
+from FiFo import Process
+
+class IOProcess(Process):
+    # Proceso con rafagas alternas de CPU y E/S: [cpu, io, cpu, io, ..., cpu]
+    def __init__(self, name, bursts, priority=None, relative_deadline=None):
+        if len(bursts) % 2 == 0:
+            raise ValueError("bursts must start and end with a CPU burst")
+        super().__init__(name, bursts[0])
+        if priority is not None:
+            self.priority = priority
+        if relative_deadline is not None:
+            self.relative_deadline = relative_deadline
+            self.deadline = None
+        self.bursts = list(bursts)
+        self._burst_index = 0
+
+    def has_pending_io(self):
+        return self._burst_index + 1 < len(self.bursts)
+
+    def getIOTime(self):
+        return self.bursts[self._burst_index + 1]
+
+    def start_next_burst(self):
+        # Tras la E/S, carga la siguiente rafaga de CPU en execution_time
+        self._burst_index += 2
+        self.execution_time = self.bursts[self._burst_index]
@@ -0,0 +1,84 @@
+class IndexedHeap:
+    # Monticulo binario con indice de posiciones: ademas de push/pop permite
+    # eliminar un elemento o reubicarlo tras cambiar su clave (decrease-key) en O(log n).
+    def __init__(self, key):
+        self.key = key
+        self.heap = []       # Entradas [clave, orden de llegada, elemento]
+        self.positions = {}  # id(elemento) -> indice en heap
+        self._counter = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def __iter__(self):
+        return iter(entry[2] for entry in sorted(self.heap, key=lambda entry: entry[:2]))
+
+    def push(self, item):
+        self.heap.append([self.key(item), self._counter, item])
+        self._counter += 1
+        self.positions[id(item)] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def peek(self):
+        if not self.heap:
+            raise IndexError("peek from an empty IndexedHeap")
+        return self.heap[0][2]
+
+    def pop(self):
+        if not self.heap:
+            raise IndexError("pop from an empty IndexedHeap")
+        item = self.heap[0][2]
+        self._remove_at(0)
+        return item
+
+    def remove(self, item):
+        if id(item) not in self.positions:
+            raise ValueError("item not in IndexedHeap")
+        self._remove_at(self.positions[id(item)])
+
+    def update(self, item):
+        # Recalcula la clave de `item` y lo reubica (decrease-key o increase-key)
+        index = self.positions[id(item)]
+        self.heap[index][0] = self.key(item)
+        self._sift_down(self._sift_up(index))
+
+    def _remove_at(self, index):
+        entry = self.heap[index]
+        last = self.heap.pop()
+        del self.positions[id(entry[2])]
+        if index < len(self.heap):
+            self.heap[index] = last
+            self.positions[id(last[2])] = index
+            self._sift_down(self._sift_up(index))
+
+    def _less(self, i, j):
+        return self.heap[i][:2] < self.heap[j][:2]
+
+    def _swap(self, i, j):
+        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.positions[id(self.heap[i][2])] = i
+        self.positions[id(self.heap[j][2])] = j
+
+    def _sift_up(self, index):
+        while index > 0:
+            parent = (index - 1) // 2
+            if not self._less(index, parent):
+                break
+            self._swap(index, parent)
+            index = parent
+        return index
+
+    def _sift_down(self, index):
+        size = len(self.heap)
+        while True:
+            smallest = index
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < size and self._less(child, smallest):
+                    smallest = child
+            if smallest == index:
+                return index
+            self._swap(index, smallest)
+            index = smallest
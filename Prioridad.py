@@ -1,4 +1,5 @@
 import random
+from IndexedHeap import IndexedHeap
 
 class Process:
     _first_time = True
@@ -37,6 +38,9 @@ class Process:
 class Prioridad:
     def __init__(self):
         self.queue = []
+        self.last_process = None  # Ultimo proceso que uso la CPU
+        self.last_time = None
+        self.context_switches = 0  # Cambios de la CPU a un proceso distinto
         self.current_process = None
 
     def add_process(self, process, current_time):
@@ -45,11 +49,15 @@ class Prioridad:
         self.queue.append(process)
         self.queue.sort(key=lambda p: p.priority)
 
+    def ready_count(self):
+        # Procesos en espera; current_process (o la cabeza, si no hay) ocupa la CPU
+        return len(self.queue) - (0 if self.current_process is not None or not self.queue else 1)
+
     def execute(self, current_time, debug=False, output_callback=print):
         msg = f"Current Time: {current_time:<3}"
         if debug:
-            print(msg, end="\t" if self.queue else "\n")
-        output_callback(msg, end="\t" if self.queue else "\n")
+            print(msg, end="\t" if self.queue or self.current_process else "\n")
+        output_callback(msg, end="\t" if self.queue or self.current_process else "\n")
         
         if self.current_process is None and self.queue:
             self.current_process = self.queue.pop(0)
@@ -62,14 +70,81 @@ class Prioridad:
                     print(msg)
                 output_callback(msg)
                 process._first_time = False
+            elif process is not self.last_process or current_time != self.last_time + 1:
+                # Reanudado tras otro proceso o tras E/S: se muestra su nombre
+                msg = f"{process.name:<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+            else:
+                msg = f"{'':<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+            process.execution_time -= 1
+            if self.last_process is not None and process is not self.last_process:
+                self.context_switches += 1
+            self.last_process = process
+            self.last_time = current_time
+            if process.execution_time == 0:
+                process.setEndTime(current_time + 1)
+                self.current_process = None
+                return process
+        return None
+
+class PrioridadApropiativa:
+    def __init__(self):
+        self.queue = IndexedHeap(key=lambda p: p.priority)
+        self.last_process = None  # Ultimo proceso que uso la CPU
+        self.last_time = None
+        self.current_process = None
+        self.context_switches = 0  # Cambios de la CPU a un proceso distinto
+
+    def add_process(self, process, current_time):
+        if process.getArrivalTime() is None:
+            process.setArrivalTime(current_time)
+        self.queue.push(process)
+
+    def ready_count(self):
+        # Procesos en espera; la cima del monticulo es la que ocupa la CPU
+        return max(len(self.queue) - 1, 0)
+
+    def execute(self, current_time, debug=False, output_callback=print):
+        msg = f"Current Time: {current_time:<3}"
+        if debug:
+            print(msg, end="\t" if self.queue else "\n")
+        output_callback(msg, end="\t" if self.queue else "\n")
+
+        if self.queue:
+            # El proceso en ejecucion sigue en el monticulo; si otro llega a la cima, hay apropiacion
+            process = self.queue.peek()
+            self.current_process = process
+            if process._first_time:
+                process.setStartTime(current_time)
+                msg = f"{process.name:<10} Arrival Time: {process.getArrivalTime():<5} Execution Time: {process.execution_time:<5} P:{process.priority:<2}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+                process._first_time = False
+            elif process is not self.last_process or current_time != self.last_time + 1:
+                # Reanudado tras otro proceso o tras E/S: se muestra su nombre
+                msg = f"{process.name:<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
             else:
                 msg = f"{'':<29} Execution Time: {process.execution_time:<5}"
                 if debug:
                     print(msg)
                 output_callback(msg)
             process.execution_time -= 1
+            if self.last_process is not None and process is not self.last_process:
+                self.context_switches += 1
+            self.last_process = process
+            self.last_time = current_time
             if process.execution_time == 0:
                 process.setEndTime(current_time + 1)
+                self.queue.pop()
                 self.current_process = None
                 return process
         return None
@@ -0,0 +1,70 @@
+from collections import deque
+
+class RoundRobin:
+    def __init__(self, quantum=2):
+        if quantum < 1:
+            raise ValueError("quantum must be at least 1")
+        self.queue = deque()
+        self.last_process = None  # Ultimo proceso que uso la CPU
+        self.last_time = None
+        self.current_process = None
+        self.quantum = quantum
+        self.quantum_left = quantum
+        self.context_switches = 0  # Cambios de la CPU a un proceso distinto
+
+    def add_process(self, process, current_time):
+        if process.getArrivalTime() is None:
+            process.setArrivalTime(current_time)
+        self.queue.append(process)
+
+    def ready_count(self):
+        # Procesos en espera; current_process (o la cabeza, si no hay) ocupa la CPU
+        return len(self.queue) - (0 if self.current_process is not None or not self.queue else 1)
+
+    def execute(self, current_time, debug=False, output_callback=print):
+        msg = f"Current Time: {current_time:<3}"
+        if debug:
+            print(msg, end="\t" if self.queue or self.current_process else "\n")
+        output_callback(msg, end="\t" if self.queue or self.current_process else "\n")
+
+        # Al agotar el quantum, el proceso vuelve al final de la cola si hay otro esperando
+        if self.current_process and self.quantum_left == 0:
+            if self.queue:
+                self.queue.append(self.current_process)
+                self.current_process = None
+            else:
+                self.quantum_left = self.quantum
+        if self.current_process is None and self.queue:
+            self.current_process = self.queue.popleft()
+            self.quantum_left = self.quantum
+        if self.current_process:
+            process = self.current_process
+            if process._first_time:
+                process.setStartTime(current_time)
+                msg = f"{process.name:<10} Arrival Time: {process.getArrivalTime():<5} Execution Time: {process.execution_time:<5} Q:{self.quantum_left:<2}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+                process._first_time = False
+            elif process is not self.last_process or current_time != self.last_time + 1:
+                # Reanudado tras otro proceso o tras E/S: se muestra su nombre
+                msg = f"{process.name:<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+            else:
+                msg = f"{'':<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+            process.execution_time -= 1
+            if self.last_process is not None and process is not self.last_process:
+                self.context_switches += 1
+            self.last_process = process
+            self.last_time = current_time
+            self.quantum_left -= 1
+            if process.execution_time == 0:
+                process.setEndTime(current_time + 1)
+                self.current_process = None
+                return process
+        return None
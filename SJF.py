@@ -1,4 +1,5 @@
 import random
+from IndexedHeap import IndexedHeap
 
 class Process:
     _first_time = True
@@ -36,6 +37,9 @@ class Process:
 class SJF:
     def __init__(self):
         self.queue = []
+        self.last_process = None  # Ultimo proceso que uso la CPU
+        self.last_time = None
+        self.context_switches = 0  # Cambios de la CPU a un proceso distinto
 
     def add_process(self, process, current_time):
         if process.getArrivalTime() is None:
@@ -43,6 +47,10 @@ class SJF:
         self.queue.append(process)
         self.queue.sort(key=lambda p: p.execution_time)
 
+    def ready_count(self):
+        # Procesos en espera; queue[0] es el que ocupa la CPU
+        return max(len(self.queue) - 1, 0)
+
     def execute(self, current_time, debug=False, output_callback=print):
         msg = f"Current Time: {current_time:<3}"
         if debug:
@@ -58,18 +66,86 @@ class SJF:
                     print(msg)
                 output_callback(msg)
                 process._first_time = False
+            elif process is not self.last_process or current_time != self.last_time + 1:
+                # Reanudado tras otro proceso o tras E/S: se muestra su nombre
+                msg = f"{process.name:<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
             else:
                 msg = f"{'':<29} Execution Time: {process.execution_time:<5}"
                 if debug:
                     print(msg)
                 output_callback(msg)
             process.execution_time -= 1
+            if self.last_process is not None and process is not self.last_process:
+                self.context_switches += 1
+            self.last_process = process
+            self.last_time = current_time
             if process.execution_time == 0:
                 process.setEndTime(current_time + 1)
                 self.queue.pop(0)
                 return process
         return None
 
+class SRTF:
+    def __init__(self):
+        self.queue = IndexedHeap(key=lambda p: p.execution_time)
+        self.last_process = None  # Ultimo proceso que uso la CPU
+        self.last_time = None
+        self.current_process = None
+        self.context_switches = 0  # Cambios de la CPU a un proceso distinto
+
+    def add_process(self, process, current_time):
+        if process.getArrivalTime() is None:
+            process.setArrivalTime(current_time)
+        self.queue.push(process)
+
+    def ready_count(self):
+        # Procesos en espera; la cima del monticulo es la que ocupa la CPU
+        return max(len(self.queue) - 1, 0)
+
+    def execute(self, current_time, debug=False, output_callback=print):
+        msg = f"Current Time: {current_time:<3}"
+        if debug:
+            print(msg, end="\t" if self.queue else "\n")
+        output_callback(msg, end="\t" if self.queue else "\n")
+
+        if self.queue:
+            # El proceso en ejecucion sigue en el monticulo; si otro llega a la cima, hay apropiacion
+            process = self.queue.peek()
+            self.current_process = process
+            if process._first_time:
+                process.setStartTime(current_time)
+                msg = f"{process.name:<10} Arrival Time: {process.getArrivalTime():<5} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+                process._first_time = False
+            elif process is not self.last_process or current_time != self.last_time + 1:
+                # Reanudado tras otro proceso o tras E/S: se muestra su nombre
+                msg = f"{process.name:<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+            else:
+                msg = f"{'':<29} Execution Time: {process.execution_time:<5}"
+                if debug:
+                    print(msg)
+                output_callback(msg)
+            process.execution_time -= 1
+            if self.last_process is not None and process is not self.last_process:
+                self.context_switches += 1
+            self.last_process = process
+            self.last_time = current_time
+            if process.execution_time == 0:
+                process.setEndTime(current_time + 1)
+                self.queue.pop()
+                self.current_process = None
+                return process
+            self.queue.update(process)  # decrease-key: el tiempo restante bajo
+        return None
+
 class Time:
     def __init__(self, algorithm, generator):
         self.current_time = 0
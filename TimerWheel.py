@@ -0,0 +1,66 @@
+class TimerWheel:
+    # Rueda de temporizadores jerarquica: cada nivel tiene `slot_count` ranuras y
+    # cubre `slot_count` veces el rango del nivel anterior. Programar y disparar un
+    # temporizador cuesta O(1) amortizado (cada entrada baja como mucho `levels` veces).
+    def __init__(self, slot_count=64, levels=4, start_time=0):
+        self.slot_bits = slot_count.bit_length() - 1
+        if slot_count != 1 << self.slot_bits:
+            raise ValueError("slot_count must be a power of two")
+        if levels < 1:
+            raise ValueError("levels must be at least 1")
+        self.slot_mask = slot_count - 1
+        self.levels = levels
+        self.current_time = start_time
+        self.wheels = [[[] for _ in range(slot_count)] for _ in range(levels)]
+        self.overflow = []  # Mas alla del rango del nivel superior
+        self.expired = []   # Programados para un tiempo ya alcanzado
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def schedule(self, expire_time, item):
+        self.size += 1
+        self._insert(expire_time, item)
+
+    def _insert(self, expire_time, item):
+        delta = expire_time - self.current_time
+        if delta <= 0:
+            self.expired.append(item)
+            return
+        for level in range(self.levels):
+            if delta < 1 << (self.slot_bits * (level + 1)):
+                slot = (expire_time >> (self.slot_bits * level)) & self.slot_mask
+                self.wheels[level][slot].append((expire_time, item))
+                return
+        self.overflow.append((expire_time, item))
+
+    def _cascade(self, level):
+        slot = (self.current_time >> (self.slot_bits * level)) & self.slot_mask
+        entries = self.wheels[level][slot]
+        self.wheels[level][slot] = []
+        for expire_time, item in entries:
+            self._insert(expire_time, item)
+
+    def advance(self, time):
+        # Avanza la rueda hasta `time` y devuelve los elementos que vencen
+        fired = self.expired
+        self.expired = []
+        while self.current_time < time:
+            self.current_time += 1
+            # Al dar la vuelta el nivel superior, el desbordamiento vuelve a la rueda
+            if self.overflow and self.current_time & ((1 << (self.slot_bits * self.levels)) - 1) == 0:
+                entries, self.overflow = self.overflow, []
+                for expire_time, item in entries:
+                    self._insert(expire_time, item)
+            # Cascada de arriba hacia abajo en los limites de cada nivel
+            for level in range(self.levels - 1, 0, -1):
+                if self.current_time & ((1 << (self.slot_bits * level)) - 1) == 0:
+                    self._cascade(level)
+            slot = self.current_time & self.slot_mask
+            fired.extend(item for _, item in self.wheels[0][slot])
+            self.wheels[0][slot] = []
+            fired.extend(self.expired)
+            self.expired = []
+        self.size -= len(fired)
+        return fired
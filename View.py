@@ -1,15 +1,25 @@
 import tkinter as tk
 from tkinter import ttk
 from FiFo import FIFO
-from SJF import SJF
-from Prioridad import Prioridad
-from Controller import Gestor, Metrics
+from SJF import SJF, SRTF
+from Prioridad import Prioridad, PrioridadApropiativa
+from RoundRobin import RoundRobin
+from EDF import EDF
+from Controller import AdmissionControl, Gestor, Metrics
 
 class PlanificadorView:
+    ADMISSION_POLICIES = {
+        "Descartar nuevo": AdmissionControl.DROP_NEWEST,
+        "Descartar antiguo": AdmissionControl.DROP_OLDEST,
+        "Descartar menor prioridad": AdmissionControl.DROP_LOWEST_PRIORITY,
+        "Rechazar y reintentar": AdmissionControl.REJECT_RETRY,
+    }
+    PRIORITY_ALGORITHMS = ("Prioridad", "Prioridad apropiativa")
+
     def __init__(self, root):
         self.root = root
         self.root.title("Planificador de Procesos")
-        self.root.geometry("800x400")  # Aumentar ancho de ventana
+        self.root.geometry("800x460")  # Aumentar ancho de ventana
         self.root.resizable(False, False)  # Deshabilitar redimensionamiento
         
         # Inicializar el gestor con FIFO como algoritmo inicial
@@ -24,51 +34,147 @@ class PlanificadorView:
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Selector de algoritmo
-        ttk.Label(main_frame, text="Algoritmo:").grid(row=0, column=0, sticky=tk.W)
+        selector_frame = ttk.Frame(main_frame)
+        selector_frame.grid(row=0, column=0, columnspan=2, sticky=tk.W)
+        ttk.Label(selector_frame, text="Algoritmo:").grid(row=0, column=0, sticky=tk.W)
         self.algorithm_var = tk.StringVar(value="FIFO")
-        algorithm_combo = ttk.Combobox(main_frame, 
+        algorithm_combo = ttk.Combobox(selector_frame, 
                                      textvariable=self.algorithm_var,
-                                     values=["FIFO", "SJF", "Prioridad"],
+                                     values=["FIFO", "SJF", "Prioridad", "EDF", "EDF apropiativo",
+                                             "SRTF", "Prioridad apropiativa", "Round Robin"],
                                      state="readonly")
         algorithm_combo.grid(row=0, column=1, sticky=tk.W)
         algorithm_combo.bind('<<ComboboxSelected>>', self.change_algorithm)
+
+        # Quantum para Round Robin, visible solo con ese algoritmo
+        self.quantum_label = ttk.Label(selector_frame, text="Quantum:")
+        self.quantum_label.grid(row=0, column=2, sticky=tk.W, padx=(10, 0))
+        self.quantum_var = tk.IntVar(value=2)
+        self.quantum_spinbox = ttk.Spinbox(selector_frame, from_=1, to=20, width=4, textvariable=self.quantum_var,
+                                           command=self.change_algorithm)
+        self.quantum_spinbox.grid(row=0, column=3, sticky=tk.W)
+        self.quantum_spinbox.bind('<FocusOut>', self.change_algorithm)
+        self.quantum_label.grid_remove()
+        self.quantum_spinbox.grid_remove()
         
+        # Cola de listos acotada
+        admission_frame = ttk.LabelFrame(main_frame, text="Cola de listos", padding="5")
+        admission_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        ttk.Label(admission_frame, text="Capacidad (0 = sin límite):").grid(row=0, column=0, sticky=tk.W)
+        self.capacity_var = tk.IntVar(value=0)
+        ttk.Spinbox(admission_frame, from_=0, to=100, width=4,
+                    textvariable=self.capacity_var).grid(row=0, column=1, sticky=tk.W)
+        ttk.Label(admission_frame, text="Política:").grid(row=0, column=2, sticky=tk.W, padx=(10, 0))
+        self.policy_var = tk.StringVar(value="Descartar nuevo")
+        self.policy_combo = ttk.Combobox(admission_frame,
+                                         textvariable=self.policy_var,
+                                         state="readonly")
+        self.policy_combo.grid(row=0, column=3, sticky=tk.W)
+        self.update_policy_choices()
+
+        # Rafagas de CPU y E/S (1 rafaga = procesos sin E/S)
+        io_frame = ttk.LabelFrame(main_frame, text="Ráfagas", padding="5")
+        io_frame.grid(row=1, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
+        ttk.Label(io_frame, text="CPU máx.:").grid(row=0, column=0, sticky=tk.W)
+        self.max_cpu_bursts_var = tk.IntVar(value=1)
+        ttk.Spinbox(io_frame, from_=1, to=10, width=4,
+                    textvariable=self.max_cpu_bursts_var).grid(row=0, column=1, sticky=tk.W)
+        ttk.Label(io_frame, text="E/S:").grid(row=0, column=2, sticky=tk.W, padx=(10, 0))
+        self.min_io_var = tk.IntVar(value=1)
+        ttk.Spinbox(io_frame, from_=1, to=20, width=4,
+                    textvariable=self.min_io_var).grid(row=0, column=3, sticky=tk.W)
+        ttk.Label(io_frame, text="-").grid(row=0, column=4)
+        self.max_io_var = tk.IntVar(value=5)
+        ttk.Spinbox(io_frame, from_=1, to=20, width=4,
+                    textvariable=self.max_io_var).grid(row=0, column=5, sticky=tk.W)
+
         # Métricas
         metrics_frame = ttk.LabelFrame(main_frame, text="Métricas", padding="5")
-        metrics_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E))
+        metrics_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E))
         
         self.te_var = tk.StringVar(value="Te promedio: --")
         self.ts_var = tk.StringVar(value="Ts promedio: --")
+        self.drop_var = tk.StringVar(value="Descartados: --")
+        self.retry_var = tk.StringVar(value="Reintentos: --")
+        self.cpu_var = tk.StringVar(value="Uso de CPU: --")
+        self.io_var = tk.StringVar(value="Solapamiento E/S: --")
+        self.deadline_var = tk.StringVar(value="Deadlines perdidos: --")
+        self.lateness_var = tk.StringVar(value="Retraso p50/p95: --")
+        self.switch_var = tk.StringVar(value="Cambios de contexto: --")
         
         ttk.Label(metrics_frame, textvariable=self.te_var).grid(row=0, column=0, sticky=tk.W)
         ttk.Label(metrics_frame, textvariable=self.ts_var).grid(row=1, column=0, sticky=tk.W)
+        ttk.Label(metrics_frame, textvariable=self.drop_var).grid(row=0, column=1, sticky=tk.W)
+        ttk.Label(metrics_frame, textvariable=self.retry_var).grid(row=1, column=1, sticky=tk.W)
+        ttk.Label(metrics_frame, textvariable=self.cpu_var).grid(row=0, column=2, sticky=tk.W)
+        ttk.Label(metrics_frame, textvariable=self.io_var).grid(row=1, column=2, sticky=tk.W)
+        ttk.Label(metrics_frame, textvariable=self.deadline_var).grid(row=0, column=3, sticky=tk.W)
+        ttk.Label(metrics_frame, textvariable=self.lateness_var).grid(row=1, column=3, sticky=tk.W)
+        ttk.Label(metrics_frame, textvariable=self.switch_var).grid(row=2, column=0, sticky=tk.W)
         
         # Botones de control
-        ttk.Button(main_frame, text="Iniciar", command=self.start_simulation).grid(row=2, column=0)
-        ttk.Button(main_frame, text="Detener", command=self.stop_simulation).grid(row=2, column=1)
+        ttk.Button(main_frame, text="Iniciar", command=self.start_simulation).grid(row=3, column=0)
+        ttk.Button(main_frame, text="Detener", command=self.stop_simulation).grid(row=3, column=1)
         
         # Área de log con título
-        ttk.Label(main_frame, text="Log de ejecución:").grid(row=3, column=0, columnspan=2, sticky=tk.W)
+        ttk.Label(main_frame, text="Log de ejecución:").grid(row=4, column=0, columnspan=2, sticky=tk.W)
         self.log_text = tk.Text(main_frame, height=15, width=90)  # Aumentar width de 70 a 90
-        self.log_text.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E))
+        self.log_text.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E))
         
         # Scrollbar para el log
         scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=self.log_text.yview)
-        scrollbar.grid(row=4, column=2, sticky=(tk.N, tk.S))
+        scrollbar.grid(row=5, column=2, sticky=(tk.N, tk.S))
         self.log_text.configure(yscrollcommand=scrollbar.set)
         
         # Configurar pesos de las filas y columnas
         main_frame.columnconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
         
+    def get_quantum(self):
+        try:
+            quantum = self.quantum_var.get()
+        except tk.TclError:
+            quantum = 0
+        if quantum < 1:
+            quantum = 2  # Valor no valido: se vuelve al quantum por defecto
+            self.quantum_var.set(quantum)
+        return quantum
+
+    def update_policy_choices(self):
+        # "Descartar menor prioridad" solo tiene sentido con procesos con prioridad;
+        # en los demas algoritmos AdmissionControl lo trataria como "Descartar nuevo"
+        policies = list(self.ADMISSION_POLICIES)
+        if self.algorithm_var.get() not in self.PRIORITY_ALGORITHMS:
+            policies.remove("Descartar menor prioridad")
+        self.policy_combo.configure(values=policies)
+        if self.policy_var.get() not in policies:
+            self.policy_var.set("Descartar nuevo")
+
     def change_algorithm(self, event=None):
         algorithm_name = self.algorithm_var.get()
+        self.update_policy_choices()
+        if algorithm_name == "Round Robin":
+            self.quantum_label.grid()
+            self.quantum_spinbox.grid()
+        else:
+            self.quantum_label.grid_remove()
+            self.quantum_spinbox.grid_remove()
         if algorithm_name == "FIFO":
             self.gestor.set_algorithm(FIFO())
         elif algorithm_name == "SJF":
             self.gestor.set_algorithm(SJF())
         elif algorithm_name == "Prioridad":
             self.gestor.set_algorithm(Prioridad())
+        elif algorithm_name == "EDF":
+            self.gestor.set_algorithm(EDF())
+        elif algorithm_name == "EDF apropiativo":
+            self.gestor.set_algorithm(EDF(preemptive=True))
+        elif algorithm_name == "SRTF":
+            self.gestor.set_algorithm(SRTF())
+        elif algorithm_name == "Prioridad apropiativa":
+            self.gestor.set_algorithm(PrioridadApropiativa())
+        elif algorithm_name == "Round Robin":
+            self.gestor.set_algorithm(RoundRobin(quantum=self.get_quantum()))
         
     def update_process_display(self):
         # Limpiar el área de texto
@@ -88,11 +194,57 @@ class PlanificadorView:
             metrics = Metrics()
             for process in self.gestor.time.completed_processes:
                 metrics.add_process(process)
+            for process in self.gestor.time.dropped_processes:
+                metrics.add_dropped_process(process)
+            metrics.add_retries(self.gestor.time.retry_count)
+            time = self.gestor.time
+            metrics.add_time_counters(time.current_time, time.cpu_busy_time, time.io_busy_time, time.overlap_time)
+            metrics.add_context_switches(time.get_context_switches())
             self.te_var.set(f"Te promedio: {metrics.calculate_average_te():.2f}")
-            self.ts_var.set(f"Ts promedio: {metrics.calculate_average_ts():.2f}")
+            self.ts_var.set(f"Ts promedio: {metrics.calculate_average_ts():.2f} (p95: {metrics.calculate_percentile_ts(95)})")
+            self.drop_var.set(f"Descartados: {len(metrics.dropped_processes)} ({metrics.calculate_drop_rate():.0%})")
+            self.retry_var.set(f"Reintentos: {metrics.retries}")
+            self.switch_var.set(f"Cambios de contexto: {metrics.context_switches}")
+            self.cpu_var.set(f"Uso de CPU: {metrics.calculate_cpu_utilization():.0%}")
+            self.io_var.set(f"Solapamiento E/S: {metrics.calculate_io_overlap():.0%}")
+            if metrics.calculate_percentile_lateness(50) is not None:
+                self.deadline_var.set(f"Deadlines perdidos: {metrics.calculate_deadline_miss_rate():.0%}")
+                self.lateness_var.set(f"Retraso p50/p95: {metrics.calculate_percentile_lateness(50)}/{metrics.calculate_percentile_lateness(95)}")
+            else:
+                self.deadline_var.set("Deadlines perdidos: --")
+                self.lateness_var.set("Retraso p50/p95: --")
     
+    def apply_admission(self):
+        try:
+            capacity = self.capacity_var.get()
+        except tk.TclError:
+            capacity = 0  # Valor no numerico: cola sin limite
+            self.capacity_var.set(capacity)
+        policy = self.ADMISSION_POLICIES[self.policy_var.get()]
+        self.gestor.set_admission(AdmissionControl(capacity=capacity if capacity > 0 else None, policy=policy))
+
+    def read_int(self, var, default, minimum=1):
+        # Los Spinbox aceptan texto libre: se corrige cualquier valor no valido
+        try:
+            value = var.get()
+        except tk.TclError:
+            value = default
+        if value < minimum:
+            value = default
+        var.set(value)
+        return value
+
+    def apply_io_bursts(self):
+        max_cpu_bursts = self.read_int(self.max_cpu_bursts_var, 1)
+        min_io_time = self.read_int(self.min_io_var, 1)
+        max_io_time = max(self.read_int(self.max_io_var, 5), min_io_time)
+        self.max_io_var.set(max_io_time)
+        self.gestor.set_io_bursts(max_cpu_bursts, min_io_time, max_io_time)
+
     def start_simulation(self):
         self.log_text.delete(1.0, tk.END)  # Clear log
+        self.apply_admission()
+        self.apply_io_bursts()
         self.gestor.run()
         self.update_metrics()
         self.update_process_display()
@@ -0,0 +1,120 @@
+import pytest
+
+from Controller import AdmissionControl, Time
+from EDF import EDF, Process as EDFProcess
+from FiFo import FIFO, Process as FIFOProcess
+from Prioridad import Prioridad, Process as PrioridadProcess
+from RoundRobin import RoundRobin
+
+
+def quiet(*args, **kwargs):
+    pass
+
+
+# (algoritmo, fabrica de procesos con nombre y prioridad)
+SCHEDULERS = {
+    "FIFO": (FIFO, lambda name, priority: FIFOProcess(name, 5)),
+    "Prioridad": (Prioridad, lambda name, priority: PrioridadProcess(name, 5, priority)),
+    "EDF": (EDF, lambda name, priority: EDFProcess(name, 5, 50)),
+    "RoundRobin": (lambda: RoundRobin(quantum=10), lambda name, priority: FIFOProcess(name, 5)),
+}
+
+
+def busy_time(scheduler, policy, capacity=2):
+    # Un proceso en ejecucion y la cola de espera llena
+    make_algorithm, make_process = SCHEDULERS[scheduler]
+    time = Time(make_algorithm(), None, admission=AdmissionControl(capacity=capacity, policy=policy))
+    running = make_process("running", 1)
+    time.add_process(running)
+    time.algorithm.execute(time.current_time, output_callback=quiet)
+    waiting = []
+    for index, priority in enumerate((3, 4)[:capacity]):
+        time.current_time += 1
+        process = make_process(f"waiting {index}", priority)
+        time.add_process(process)
+        waiting.append(process)
+    time.current_time += 1
+    return time, make_process, running, waiting
+
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS)
+def test_ready_count_excludes_running_process(scheduler):
+    time, _, _, waiting = busy_time(scheduler, AdmissionControl.DROP_NEWEST)
+    assert time.algorithm.ready_count() == len(waiting)
+    assert time.dropped_processes == []
+
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS)
+def test_drop_newest(scheduler):
+    time, make_process, _, _ = busy_time(scheduler, AdmissionControl.DROP_NEWEST)
+    newest = make_process("newest", 1)
+    time.add_process(newest)
+    assert time.dropped_processes == [newest]
+    assert newest not in list(time.algorithm.queue)
+    assert time.algorithm.ready_count() == 2
+
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS)
+def test_drop_oldest_keeps_running_process(scheduler):
+    time, make_process, running, waiting = busy_time(scheduler, AdmissionControl.DROP_OLDEST)
+    newest = make_process("newest", 1)
+    time.add_process(newest)
+    assert time.dropped_processes == [waiting[0]]
+    assert newest in list(time.algorithm.queue)
+    assert running not in time.dropped_processes
+    assert time.algorithm.ready_count() == 2
+
+
+def test_drop_lowest_priority_evicts_highest_number():
+    time, make_process, _, waiting = busy_time("Prioridad", AdmissionControl.DROP_LOWEST_PRIORITY)
+    urgent = make_process("urgent", 1)
+    time.add_process(urgent)
+    assert time.dropped_processes == [waiting[1]]  # prioridad 4
+    minor = make_process("minor", 5)
+    time.add_process(minor)
+    assert time.dropped_processes == [waiting[1], minor]
+
+
+@pytest.mark.parametrize("scheduler", ["FIFO", "EDF", "RoundRobin"])
+def test_drop_lowest_priority_without_priorities_drops_newest(scheduler):
+    # Sin atributo priority no hay a quien comparar: se comporta como DROP_NEWEST
+    time, make_process, _, _ = busy_time(scheduler, AdmissionControl.DROP_LOWEST_PRIORITY)
+    newest = make_process("newest", 1)
+    time.add_process(newest)
+    assert time.dropped_processes == [newest]
+
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS)
+def test_reject_retry_resubmits_after_delay(scheduler):
+    time, make_process, _, _ = busy_time(scheduler, AdmissionControl.REJECT_RETRY)
+    rejected = make_process("rejected", 1)
+    time.add_process(rejected)
+    arrival = time.current_time
+    assert time.retry_count == 1
+    assert time.pending_retries == [(arrival + time.admission.retry_after, rejected)]
+    assert time.dropped_processes == []
+
+    # Antes del plazo no se reintenta
+    time.current_time = arrival + time.admission.retry_after - 1
+    time._resubmit_retries()
+    assert time.retry_count == 1
+
+    # Al cumplirse el plazo se reintenta; con la cola aun llena se rechaza otra vez
+    time.current_time += 1
+    time._resubmit_retries()
+    assert time.retry_count == 2
+
+    # Al liberar un hueco, el reintento entra conservando su llegada original
+    waiting = [p for p in time.algorithm.queue if p._first_time]
+    time.algorithm.queue.remove(waiting[0])
+    time.current_time += time.admission.retry_after
+    time._resubmit_retries()
+    assert time.pending_retries == []
+    assert rejected in list(time.algorithm.queue)
+    assert rejected.getArrivalTime() == arrival
+
+
+@pytest.mark.parametrize("kwargs", [dict(capacity=0), dict(capacity=-3), dict(retry_after=-1), dict(policy="lifo")])
+def test_rejects_invalid_configuration(kwargs):
+    with pytest.raises(ValueError):
+        AdmissionControl(**kwargs)
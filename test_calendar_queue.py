@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from CalendarQueue import CalendarQueue
+
+
+class Item:
+    def __init__(self, key):
+        self.key = key
+
+
+def test_matches_sorted_reference():
+    rng = random.Random(28)
+    for _ in range(50):
+        queue = CalendarQueue(key=lambda item: item.key)
+        reference = []  # Ordenada por (clave, orden de llegada)
+        for step in range(1500):
+            action = rng.random()
+            if action < 0.55 or not reference:
+                # Claves densas que avanzan con el tiempo y algun salto lejano
+                key = rng.randint(0, 300) + step // 5 if rng.random() < 0.9 else rng.randint(0, 10**6)
+                item = Item(key)
+                queue.push(item)
+                reference.append(item)
+                reference.sort(key=lambda item: item.key)
+            elif action < 0.9:
+                assert queue.peek_key() == reference[0].key
+                assert queue.pop() is reference.pop(0)
+            else:
+                item = rng.choice(reference)
+                reference.remove(item)
+                queue.remove(item)
+            assert len(queue) == len(reference)
+        assert list(queue) == reference
+
+
+def test_equal_keys_are_fifo():
+    queue = CalendarQueue(key=lambda item: item.key)
+    items = [Item(5) for _ in range(10)]
+    for item in items:
+        queue.push(item)
+    assert [queue.pop() for _ in items] == items
+
+
+def test_key_below_last_popped():
+    queue = CalendarQueue(key=lambda item: item.key)
+    for key in (10, 20, 30):
+        queue.push(Item(key))
+    assert queue.pop().key == 10
+    queue.push(Item(2))
+    assert [queue.pop().key for _ in range(3)] == [2, 20, 30]
+
+
+def test_empty_queue_errors():
+    queue = CalendarQueue(key=lambda item: item.key)
+    assert not queue
+    with pytest.raises(IndexError):
+        queue.pop()
+    with pytest.raises(IndexError):
+        queue.peek_key()
+    with pytest.raises(ValueError):
+        queue.remove(Item(1))
@@ -0,0 +1,85 @@
+from Controller import Metrics
+from EDF import EDF, Process
+
+
+def quiet(*args, **kwargs):
+    pass
+
+
+def simulate(scheduler, arrivals, ticks):
+    # arrivals: {tick: [procesos]}; devuelve el nombre del proceso que uso la CPU en cada tick
+    timeline = []
+    for tick in range(ticks):
+        for process in arrivals.get(tick, []):
+            scheduler.add_process(process, tick)
+        scheduler.execute(tick, output_callback=quiet)
+        ran = scheduler.last_process if scheduler.last_time == tick else None
+        timeline.append(ran.name if ran else None)
+    return timeline
+
+
+def test_absolute_deadline_is_fixed_on_arrival():
+    scheduler = EDF()
+    process = Process("A", 2, relative_deadline=7)
+    scheduler.add_process(process, 4)
+    assert process.deadline == 11
+
+
+def test_runs_in_deadline_order():
+    late, early, middle = Process("late", 1, 9), Process("early", 1, 3), Process("middle", 1, 5)
+    timeline = simulate(EDF(), {0: [late, early, middle]}, 3)
+    assert timeline == ["early", "middle", "late"]
+
+
+def test_non_preemptive_keeps_running_process():
+    a, b = Process("A", 3, 20), Process("B", 1, 2)
+    scheduler = EDF()
+    assert simulate(scheduler, {0: [a], 1: [b]}, 4) == ["A", "A", "A", "B"]
+    assert b.getEndTime() == 4
+    assert scheduler.context_switches == 1
+
+
+def test_preemptive_switches_to_earlier_deadline():
+    a, b = Process("A", 3, 20), Process("B", 1, 2)
+    scheduler = EDF(preemptive=True)
+    assert simulate(scheduler, {0: [a], 1: [b]}, 4) == ["A", "B", "A", "A"]
+    assert b.getEndTime() == 2
+    assert a.getEndTime() == 4
+    assert scheduler.context_switches == 2
+
+
+def test_preemptive_does_not_switch_on_equal_deadline():
+    a, b = Process("A", 2, 5), Process("B", 1, 4)
+    assert simulate(EDF(preemptive=True), {0: [a], 1: [b]}, 3) == ["A", "A", "B"]
+
+
+def finished(name, arrival, end, relative_deadline):
+    process = Process(name, 1, relative_deadline)
+    process.setArrivalTime(arrival)
+    process.deadline = arrival + relative_deadline
+    process.setStartTime(arrival)
+    process.setEndTime(end)
+    return process
+
+
+def test_miss_rate_and_lateness_percentiles():
+    metrics = Metrics()
+    # Lateness: -3, 0, 2, 6
+    for process in (finished("a", 0, 2, 5), finished("b", 0, 5, 5), finished("c", 1, 8, 5), finished("d", 2, 13, 5)):
+        metrics.add_process(process)
+    assert metrics.calculate_deadline_miss_rate() == 0.5
+    assert metrics.calculate_percentile_lateness(50) == 0
+    assert metrics.calculate_percentile_lateness(95) == 6
+
+
+def test_dropped_deadline_processes_count_as_misses():
+    metrics = Metrics()
+    metrics.add_process(finished("on time", 0, 2, 5))
+    metrics.add_dropped_process(Process("shed", 3, 5))
+    assert metrics.calculate_deadline_miss_rate() == 0.5
+    assert metrics.calculate_percentile_lateness(50) == -3
+
+
+def test_lateness_without_deadlines_is_none():
+    assert Metrics().calculate_percentile_lateness(50) is None
+    assert Metrics().calculate_deadline_miss_rate() == 0
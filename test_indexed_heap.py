@@ -0,0 +1,70 @@
+import heapq
+import random
+
+import pytest
+
+from IndexedHeap import IndexedHeap
+
+
+class Item:
+    def __init__(self, key):
+        self.key = key
+
+
+def test_matches_heapq_reference():
+    rng = random.Random(29)
+    for _ in range(100):
+        heap = IndexedHeap(key=lambda item: item.key)
+        items = []
+        for _ in range(500):
+            action = rng.random()
+            if action < 0.4 or not items:
+                item = Item(rng.randint(0, 50))
+                heap.push(item)
+                items.append(item)
+            elif action < 0.6:
+                item = heap.pop()
+                assert item.key == min(other.key for other in items)
+                items.remove(item)
+            elif action < 0.8:
+                # decrease-key e increase-key
+                item = rng.choice(items)
+                item.key = rng.randint(-5, 60)
+                heap.update(item)
+            else:
+                item = rng.choice(items)
+                heap.remove(item)
+                items.remove(item)
+            assert len(heap) == len(items)
+            if items:
+                assert heap.peek().key == heapq.nsmallest(1, (item.key for item in items))[0]
+
+
+def test_equal_keys_are_fifo():
+    heap = IndexedHeap(key=lambda item: item.key)
+    items = [Item(3) for _ in range(10)]
+    for item in items:
+        heap.push(item)
+    assert list(heap) == items
+    assert [heap.pop() for _ in items] == items
+
+
+def test_decrease_key_moves_to_top():
+    heap = IndexedHeap(key=lambda item: item.key)
+    items = [Item(key) for key in (5, 3, 8, 9)]
+    for item in items:
+        heap.push(item)
+    items[3].key = 1
+    heap.update(items[3])
+    assert heap.peek() is items[3]
+
+
+def test_empty_heap_errors():
+    heap = IndexedHeap(key=lambda item: item.key)
+    assert not heap
+    with pytest.raises(IndexError):
+        heap.pop()
+    with pytest.raises(IndexError):
+        heap.peek()
+    with pytest.raises(ValueError):
+        heap.remove(Item(1))
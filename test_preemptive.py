@@ -0,0 +1,79 @@
+import pytest
+
+from FiFo import Process as FIFOProcess
+from Prioridad import PrioridadApropiativa, Process as PrioridadProcess
+from RoundRobin import RoundRobin
+from SJF import SRTF, Process as SJFProcess
+
+
+def quiet(*args, **kwargs):
+    pass
+
+
+def run(scheduler, arrivals, ticks):
+    # Nombre del proceso que ocupo la CPU en cada tick (None si estuvo inactiva)
+    timeline = []
+    for tick in range(ticks):
+        for process in arrivals.get(tick, []):
+            scheduler.add_process(process, tick)
+        scheduler.execute(tick, output_callback=quiet)
+        timeline.append(scheduler.last_process.name if scheduler.last_time == tick else None)
+    return timeline
+
+
+class TestSRTF:
+    def test_shorter_arrival_preempts(self):
+        a, b = SJFProcess("A", 5), SJFProcess("B", 2)
+        scheduler = SRTF()
+        assert run(scheduler, {0: [a], 1: [b]}, 7) == ["A", "B", "B", "A", "A", "A", "A"]
+        assert (b.getEndTime(), a.getEndTime()) == (3, 7)
+        assert scheduler.context_switches == 2
+
+    def test_equal_remaining_time_does_not_preempt(self):
+        # En t=1 a A le quedan 2, igual que a B: sigue el que llego antes
+        a, b = SJFProcess("A", 3), SJFProcess("B", 2)
+        assert run(SRTF(), {0: [a], 1: [b]}, 5) == ["A", "A", "A", "B", "B"]
+
+
+class TestPrioridadApropiativa:
+    def test_higher_priority_arrival_preempts(self):
+        a, b = PrioridadProcess("A", 3, 3), PrioridadProcess("B", 2, 1)
+        scheduler = PrioridadApropiativa()
+        assert run(scheduler, {0: [a], 1: [b]}, 5) == ["A", "B", "B", "A", "A"]
+        assert a.getStartTime() == 0
+        assert scheduler.context_switches == 2
+
+    def test_equal_priority_waits(self):
+        a, b = PrioridadProcess("A", 2, 2), PrioridadProcess("B", 1, 2)
+        assert run(PrioridadApropiativa(), {0: [a], 1: [b]}, 3) == ["A", "A", "B"]
+
+
+class TestRoundRobin:
+    def test_quantum_rotation(self):
+        a, b = FIFOProcess("A", 3), FIFOProcess("B", 3)
+        scheduler = RoundRobin(quantum=2)
+        assert run(scheduler, {0: [a, b]}, 6) == ["A", "A", "B", "B", "A", "B"]
+        assert (a.getEndTime(), b.getEndTime()) == (5, 6)
+        assert scheduler.context_switches == 3
+
+    def test_lone_process_keeps_cpu_after_quantum(self):
+        scheduler = RoundRobin(quantum=2)
+        assert run(scheduler, {0: [FIFOProcess("A", 5)]}, 5) == ["A"] * 5
+        assert scheduler.context_switches == 0
+
+    def test_rejects_non_positive_quantum(self):
+        with pytest.raises(ValueError):
+            RoundRobin(quantum=0)
+
+
+def test_resumed_process_is_named_in_log():
+    lines = []
+    scheduler = RoundRobin(quantum=2)
+    scheduler.add_process(FIFOProcess("A", 3), 0)
+    scheduler.add_process(FIFOProcess("B", 3), 0)
+    for tick in range(6):
+        scheduler.execute(tick, output_callback=lambda msg, end="\n": lines.append(msg))
+    process_lines = [line for line in lines if not line.startswith("Current Time")]
+    assert process_lines[4].startswith("A ")
+    assert process_lines[5].startswith("B ")
+    assert process_lines[1].startswith(" ")
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from TimerWheel import TimerWheel
+
+
+@pytest.mark.parametrize("slot_count,levels", [(1, 1), (4, 1), (8, 1), (8, 2), (8, 3), (64, 4)])
+def test_fires_exactly_at_expire_time(slot_count, levels):
+    rng = random.Random(slot_count * 10 + levels)
+    wheel = TimerWheel(slot_count=slot_count, levels=levels)
+    pending = {}  # tiempo de vencimiento -> elementos esperados (lista de referencia)
+    for time in range(1, 5000):
+        for _ in range(rng.randint(0, 3)):
+            expire_time = time - 1 + rng.choice([1, 2, 7, 8, 9, 63, 64, 65, 511, 512, 513, 3000])
+            item = object()
+            wheel.schedule(expire_time, item)
+            pending.setdefault(expire_time, []).append(item)
+        fired = wheel.advance(time)
+        assert sorted(map(id, fired)) == sorted(map(id, pending.pop(time, [])))
+        assert len(wheel) == sum(len(items) for items in pending.values())
+
+
+def test_past_expire_time_fires_on_next_advance():
+    wheel = TimerWheel(slot_count=8, levels=2)
+    wheel.advance(10)
+    wheel.schedule(3, "late")
+    assert wheel.advance(10) == ["late"]
+    assert len(wheel) == 0
+
+
+def test_far_timer_fires_through_overflow():
+    wheel = TimerWheel(slot_count=4, levels=1)
+    wheel.schedule(1000, "far")
+    fired_at = [time for time in range(1, 1001) if wheel.advance(time)]
+    assert fired_at == [1000]
+
+
+def test_rejects_invalid_geometry():
+    with pytest.raises(ValueError):
+        TimerWheel(slot_count=6)
+    with pytest.raises(ValueError):
+        TimerWheel(levels=0)